@@ -1,34 +1,48 @@
 import os
-import uuid
-import re
 import django
-from django.core.files import File
 from django.conf import settings
 
 # Setup Django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 django.setup()
 
-from files.models import File as FileModel
+from files.models import (
+    File as FileModel,
+    UUID_BASENAME_MAX_LENGTH,
+    UUID_BASENAME_MIN_LENGTH,
+    file_upload_path,
+    is_uuid_basename,
+)
 
 def is_uuid_filename(filename):
     """Check if filename follows UUID pattern"""
-    pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\.[a-z0-9]+$'
-    return bool(re.match(pattern, filename.lower()))
+    if not UUID_BASENAME_MIN_LENGTH <= len(filename) <= UUID_BASENAME_MAX_LENGTH:
+        return False
+    return is_uuid_basename(filename.lower())
 
 def cleanup_files():
     """Rename any remaining non-UUID files"""
     media_dir = os.path.join(settings.MEDIA_ROOT, 'uploads')
+    pending = []
 
-    # Get all files in the uploads directory
-    for filename in os.listdir(media_dir):
-        if not is_uuid_filename(filename):
-            old_path = os.path.join(media_dir, filename)
+    # Walk the uploads directory once; DirEntry caches the file type, so
+    # skipping directories does not need an extra stat
+    try:
+        entries = os.scandir(media_dir)
+    except FileNotFoundError:
+        print(f"No uploads directory at {media_dir}, nothing to clean up")
+        return
 
-            # Generate new UUID filename
-            _, ext = os.path.splitext(filename)
-            ext = ext.lower() if ext else ''
-            new_filename = f"{uuid.uuid4()}{ext}"
+    with entries:
+        for entry in entries:
+            filename = entry.name
+            if not entry.is_file() or is_uuid_filename(filename):
+                continue
+            old_path = entry.path
+
+            # Generate new UUID filename the same way uploads do
+            new_name = file_upload_path(None, filename)
+            new_filename = new_name.rpartition('/')[2]
             new_path = os.path.join(media_dir, new_filename)
 
             try:
@@ -36,14 +50,18 @@ def cleanup_files():
                 os.rename(old_path, new_path)
                 print(f"Renamed: {filename} -> {new_filename}")
 
-                # Update any database records
-                for file_obj in FileModel.objects.filter(file__endswith=filename):
-                    with open(new_path, 'rb') as f:
-                        file_obj.file.save(new_filename, File(f), save=True)
-                    print(f"Updated database record for {filename}")
+                # Point database records at the renamed file. The file is
+                # already in place, so only the stored name needs updating.
+                for file_obj in FileModel.objects.filter(file__endswith=filename).only('id', 'file'):
+                    file_obj.file.name = new_name
+                    pending.append(file_obj)
 
             except Exception as e:
                 print(f"Error processing {filename}: {str(e)}")
 
+    # Write all renamed records back in batches instead of one UPDATE per row
+    FileModel.objects.bulk_update(pending, ['file'], batch_size=1000)
+    print(f"Updated {len(pending)} database records")
+
 if __name__ == '__main__':
     cleanup_files()
\ No newline at end of file
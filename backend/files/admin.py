@@ -1,9 +1,42 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 from .models import File
+from .utils import hash_file_path
 
 @admin.register(File)
 class FileAdmin(admin.ModelAdmin):
     list_display = ['original_filename', 'file_type', 'size', 'uploaded_at']
     list_filter = ['file_type', 'uploaded_at']
     search_fields = ['original_filename', 'file_hash']
-    readonly_fields = ['id', 'uploaded_at', 'file_hash', 'size']
\ No newline at end of file
+    readonly_fields = ['id', 'uploaded_at', 'file_hash', 'size']
+    actions = ['verify_hashes']
+
+    @admin.action(description='Verify stored file hashes')
+    def verify_hashes(self, request, queryset):
+        """Rehash the selected files on disk and report any mismatches."""
+        checked = 0
+        problems = []
+        for file_obj in queryset.only('id', 'file', 'file_hash', 'original_filename'):
+            if not file_obj.file:
+                continue
+            if file_obj.file_hash is None:
+                # Nothing to compare against; rehashing would only report a
+                # false mismatch
+                problems.append(f'{file_obj.original_filename} (no stored hash)')
+                continue
+            try:
+                digest = hash_file_path(file_obj.file.path)
+            except FileNotFoundError:
+                problems.append(f'{file_obj.original_filename} (missing on disk)')
+                continue
+            checked += 1
+            if digest != file_obj.file_hash:
+                problems.append(f'{file_obj.original_filename} (hash mismatch)')
+
+        if problems:
+            self.message_user(
+                request,
+                f'{len(problems)} file(s) failed verification: {", ".join(problems)}',
+                messages.ERROR
+            )
+        else:
+            self.message_user(request, f'{checked} file(s) verified', messages.SUCCESS)
@@ -1,6 +1,37 @@
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
 from django.apps import AppConfig
 
 
 class FilesConfig(AppConfig):
   default_auto_field = "django.db.models.BigAutoField"
   name = "files"
+
+  def ready(self):
+    from . import signals  # noqa: F401  (registers cache invalidation)
+    self._queue_log_handlers()
+
+  @staticmethod
+  def _queue_log_handlers():
+    """Move the 'files' logger's handlers onto a background thread.
+
+    Request threads only enqueue records; a QueueListener writes them to
+    the handlers configured in settings.LOGGING, so file I/O and handler
+    locks stay off the request path.
+    """
+    logger = logging.getLogger('files')
+    handlers = logger.handlers[:]
+    if not handlers or any(isinstance(h, QueueHandler) for h in handlers):
+      return
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    for handler in handlers:
+      logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+    listener.start()
+    # Flush queued records on shutdown
+    atexit.register(listener.stop)
@@ -0,0 +1,21 @@
+from django.core.cache import cache
+
+# Listing responses are cached briefly; writes invalidate them immediately
+# by bumping the version embedded in every listing cache key
+LIST_CACHE_TIMEOUT = 5  # seconds
+LIST_VERSION_KEY = 'files:list_version'
+
+
+def get_list_version():
+    """Return the current file listing cache version."""
+    return cache.get_or_set(LIST_VERSION_KEY, 1, timeout=None)
+
+
+def bump_list_version():
+    """Invalidate every cached file listing by moving to a new version."""
+    cache.add(LIST_VERSION_KEY, 1, timeout=None)
+    try:
+        cache.incr(LIST_VERSION_KEY)
+    except ValueError:
+        # The version key was evicted between add() and incr()
+        cache.set(LIST_VERSION_KEY, 2, timeout=None)
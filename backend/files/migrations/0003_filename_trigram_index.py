@@ -0,0 +1,33 @@
+from django.db import migrations
+
+INDEX_NAME = 'file_fname_trgm'
+
+def create_trigram_index(apps, schema_editor):
+    """Index original_filename for substring search on PostgreSQL.
+
+    icontains compiles to UPPER(original_filename::text) LIKE UPPER('%term%'),
+    so the pg_trgm GIN index is built on that same expression. Other
+    backends have no trigram support and are left unchanged.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON files_file '
+        'USING gin (UPPER(original_filename) gin_trgm_ops)'
+    )
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {INDEX_NAME}')
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('files', '0002_add_category'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
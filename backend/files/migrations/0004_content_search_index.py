@@ -0,0 +1,32 @@
+from django.db import migrations
+
+INDEX_NAME = 'file_content_fts'
+
+def create_content_search_index(apps, schema_editor):
+    """Index the content column for full-text search on PostgreSQL.
+
+    The indexed expression matches what File.search() builds with
+    SearchVector('content', config='simple'), so content searches use the
+    GIN index instead of scanning every row. Other backends are unchanged.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON files_file '
+        "USING gin (to_tsvector('simple'::regconfig, COALESCE(content, '')))"
+    )
+
+def drop_content_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {INDEX_NAME}')
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('files', '0003_filename_trigram_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_content_search_index, drop_content_search_index),
+    ]
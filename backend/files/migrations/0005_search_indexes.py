@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('files', '0004_content_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='file',
+            index=models.Index(fields=['original_filename'], name='file_fname_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='file',
+            index=models.Index(fields=['-uploaded_at', 'size'], name='file_date_size'),
+        ),
+        migrations.AddIndex(
+            model_name='file',
+            index=models.Index(
+                condition=models.Q(size__gte=10485760),
+                fields=['size'],
+                name='file_large_size_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+def clear_duplicate_hashes(apps, schema_editor):
+    """Keep file_hash only on the oldest row of each duplicate group.
+
+    Concurrent uploads of the same content could create several rows with
+    one hash before the column was unique; the newer rows keep their files
+    but lose the hash so the unique constraint can be added.
+    """
+    File = apps.get_model('files', 'File')
+    duplicate_hashes = (
+        File.objects.exclude(file_hash=None)
+        .order_by()
+        .values('file_hash')
+        .annotate(rows=Count('id'))
+        .filter(rows__gt=1)
+        .values_list('file_hash', flat=True)
+    )
+    for file_hash in list(duplicate_hashes):
+        rows = File.objects.filter(file_hash=file_hash)
+        oldest = rows.aggregate(oldest=Min('uploaded_at'))['oldest']
+        keep = rows.filter(uploaded_at=oldest).order_by('id').values_list('id', flat=True)[0]
+        rows.exclude(id=keep).update(file_hash=None)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('files', '0005_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='file',
+            name='file_hash',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.RunPython(clear_duplicate_hashes, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='file',
+            name='file_hash',
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,64 @@
+from django.db import migrations, models
+
+# Frozen copy of files.utils.get_file_category as of this migration, so
+# later changes to the live mapping don't alter what the backfill does
+EXACT_CATEGORIES = {
+    'application/vnd.ms-excel': 'spreadsheet',
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': 'spreadsheet',
+    'text/csv': 'spreadsheet',
+    'text/x-python': 'code',
+    'application/javascript': 'code',
+    'text/html': 'code',
+    'text/css': 'code',
+    'application/json': 'code',
+    'application/pdf': 'document',
+    'application/msword': 'document',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'document',
+    'application/zip': 'archive',
+    'application/x-rar-compressed': 'archive',
+    'application/x-tar': 'archive',
+    'application/x-7z-compressed': 'archive',
+    'application/gzip': 'archive',
+}
+
+MAJOR_TYPE_CATEGORIES = {
+    'image': 'image',
+    'video': 'video',
+    'audio': 'audio',
+    'text': 'document',
+}
+
+def get_file_category(mime_type):
+    if not mime_type:
+        return 'other'
+    mime_type = mime_type.lower()
+    category = EXACT_CATEGORIES.get(mime_type)
+    if category:
+        return category
+    major_type, slash, _ = mime_type.partition('/')
+    if not slash:
+        return 'other'
+    return MAJOR_TYPE_CATEGORIES.get(major_type, 'other')
+
+def backfill_categories(apps, schema_editor):
+    """Set the category on rows saved without one, e.g. via bulk_create."""
+    File = apps.get_model('files', 'File')
+    pending = []
+    for file_obj in File.objects.filter(category='').only('id', 'file_type').iterator():
+        file_obj.category = get_file_category(file_obj.file_type)
+        pending.append(file_obj)
+    File.objects.bulk_update(pending, ['category'], batch_size=1000)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('files', '0006_unique_file_hash'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_categories, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='file',
+            index=models.Index(fields=['category', '-uploaded_at'], name='cat_upl_idx'),
+        ),
+    ]
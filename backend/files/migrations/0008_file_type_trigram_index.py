@@ -0,0 +1,35 @@
+from django.db import migrations
+
+INDEX_NAME = 'file_type_trgm'
+
+def create_trigram_index(apps, schema_editor):
+    """Index file_type for substring search on PostgreSQL.
+
+    Filename search ORs original_filename__icontains with
+    file_type__icontains; the planner can only combine the two trigram
+    indexes (BitmapOr) when both sides are indexed, otherwise it falls
+    back to a sequential scan. Like file_fname_trgm, the index is built on
+    the UPPER() expression that icontains compiles to.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON files_file '
+        'USING gin (UPPER(file_type) gin_trgm_ops)'
+    )
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {INDEX_NAME}')
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('files', '0007_category_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -1,17 +1,49 @@
-import mimetypes
-from django.db import models
+from django.db import connection, models
 from django.core.exceptions import ValidationError
-from .utils import get_file_category
+from .utils import FILE_CATEGORIES, get_file_category, guess_mime_type
 import uuid
 import os
-import re
 import logging
 from django.db.models import Q
 from django.utils import timezone
-from datetime import timedelta
+from django.utils.dateparse import parse_date
+from datetime import date, datetime, time, timedelta
 
 logger = logging.getLogger(__name__)
 
+# 36-character UUID, a dot and at least one extension character; the
+# upper bound matches File.file's max_length
+UUID_BASENAME_MIN_LENGTH = 38
+UUID_BASENAME_MAX_LENGTH = 255
+
+_HEX_DIGITS = frozenset('0123456789abcdef')
+_EXTENSION_CHARS = frozenset('0123456789abcdefghijklmnopqrstuvwxyz')
+
+def is_uuid_basename(basename):
+    """Check whether a lowercase basename is ``<uuid>.<ext>``.
+
+    Equivalent to matching
+    ``^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\\.[a-z0-9]+$``,
+    but the fixed 8-4-4-4-12 shape is cheaper to check by position than
+    through the regex engine.
+
+    Args:
+        basename (str): Lowercase filename without any directory part.
+
+    Returns:
+        bool: True if the basename is a UUID followed by an alphanumeric extension
+    """
+    if len(basename) < UUID_BASENAME_MIN_LENGTH or basename[36] != '.':
+        return False
+    if basename[8] != '-' or basename[13] != '-' or basename[18] != '-' or basename[23] != '-':
+        return False
+    hex_digits = basename[:36].replace('-', '')
+    return (
+        len(hex_digits) == 32
+        and _HEX_DIGITS.issuperset(hex_digits)
+        and _EXTENSION_CHARS.issuperset(basename[37:])
+    )
+
 def validate_uuid_filename(filename):
     """Validate that filename follows UUID pattern.
 
@@ -27,47 +59,89 @@ def validate_uuid_filename(filename):
         >>> validate_uuid_filename("invalid.jpg")
         # Raises ValidationError
     """
-    logger.info(f"Validating filename: {filename!r}")
+    logger.debug("Validating filename: %r", filename)
 
     if hasattr(filename, 'name'):  # Handle FieldFile objects
         filename = filename.name
-        logger.info(f"Got filename from FieldFile: {filename!r}")
+        logger.debug("Got filename from FieldFile: %r", filename)
 
     if filename is None:
-        logger.info("Filename is None")
+        logger.debug("Filename is None")
         raise ValidationError('Filename cannot be None')
 
     if not isinstance(filename, str):
-        logger.info(f"Filename is not a string, got {type(filename)}")
+        logger.debug("Filename is not a string, got %s", type(filename))
         raise ValidationError('Filename must be a string')
 
     if not filename.strip():
-        logger.info("Filename is empty or whitespace")
+        logger.debug("Filename is empty or whitespace")
         raise ValidationError('Filename cannot be empty')
 
-    basename = os.path.basename(filename).lower()
-    logger.info(f"Basename: {basename!r}")
+    basename = filename.rsplit('/', 1)[-1]
+    logger.debug("Basename: %r", basename)
 
     if not basename:
-        logger.info("Basename is empty")
+        logger.debug("Basename is empty")
         raise ValidationError('Invalid filename format')
 
-    pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\.[a-z0-9]+$'
-    if not re.match(pattern, basename):
-        logger.info(f"Basename {basename!r} does not match UUID pattern")
+    # Reject impossible lengths before lowercasing or checking characters
+    if not UUID_BASENAME_MIN_LENGTH <= len(basename) <= UUID_BASENAME_MAX_LENGTH:
+        logger.debug("Basename %r has invalid length %d", basename, len(basename))
+        raise ValidationError('Filename must be a UUID with extension')
+
+    basename = basename.lower()
+    if not is_uuid_basename(basename):
+        logger.debug("Basename %r does not match UUID pattern", basename)
         raise ValidationError('Filename must be a UUID with extension')
 
-    logger.info("Filename validation passed")
+    logger.debug("Filename validation passed")
 
 def file_upload_path(instance, filename):
     """Generate file path for new file upload"""
-    # Get the file extension
-    _, ext = os.path.splitext(filename)
-    ext = ext.lower() if ext else ''
+    # Get the lowercased extension; like os.path.splitext, leading dots
+    # (".bashrc") do not start one
+    root, dot, ext = filename.rpartition('/')[2].rpartition('.')
+    ext = f".{ext.lower()}" if dot and root.strip('.') else ''
 
     # Generate a new UUID filename
-    new_filename = f"{uuid.uuid4()}{ext}"
-    return os.path.join('uploads', new_filename)
+    return f"uploads/{uuid.uuid4()}{ext}"
+
+# Text search configuration for content search; must match the expression
+# indexed by migration 0004_content_search_index
+CONTENT_SEARCH_CONFIG = 'simple'
+
+# Static search() filters, built once rather than on every call
+_DAY = timedelta(days=1)
+_WEEK = timedelta(days=7)
+_MONTH = timedelta(days=30)
+_YEAR = timedelta(days=365)
+
+_SIZE_FILTERS = {
+    'small': Q(size__lt=1048576),  # < 1MB
+    'medium': Q(size__range=(1048576, 10485759)),  # 1-10MB, one BETWEEN range
+    'large': Q(size__gte=10485760)  # >= 10MB
+}
+
+def _start_of_day(day):
+    """Return midnight at the start of ``day`` in the current time zone.
+
+    Comparing uploaded_at against day boundaries keeps date filters
+    sargable, unlike ``uploaded_at__date`` which casts every row.
+
+    Args:
+        day (date or str): A date, or an ISO 8601 date string
+
+    Returns:
+        datetime or None: Aware datetime, or None if ``day`` is not a valid date
+    """
+    if not isinstance(day, date):
+        try:
+            day = parse_date(day)
+        except ValueError:
+            return None
+        if day is None:
+            return None
+    return timezone.make_aware(datetime.combine(day, time.min))
 
 class File(models.Model):
     """File model for storing uploaded files with deduplication support.
@@ -82,15 +156,15 @@ class File(models.Model):
         file_type (str): MIME type of the file
         size (int): File size in bytes
         uploaded_at (datetime): Timestamp of upload
-        file_hash (str): SHA-256 hash for deduplication
+        file_hash (str): SHA-256 hash for deduplication, unique (also serves duplicate lookups)
         category (str): File category based on type
         content (str): Optional text content for searchable files
 
     Indexes:
         - original_filename
-        - file_type
-        - uploaded_at
-        - size
+        - (category, uploaded_at DESC) for type-filtered listings
+        - (uploaded_at DESC, size) for date and size filters
+        - size, partial on the 'large' bucket (>= 10MB)
     """
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -102,16 +176,20 @@ class File(models.Model):
     file_type = models.CharField(max_length=100)
     size = models.BigIntegerField()
     uploaded_at = models.DateTimeField(auto_now_add=True)
-    file_hash = models.CharField(max_length=64, blank=True, null=True)
+    file_hash = models.CharField(max_length=64, blank=True, null=True, unique=True)
     category = models.CharField(max_length=50, blank=True)
     content = models.TextField(null=True, blank=True)
 
     class Meta:
         indexes = [
-            models.Index(fields=['original_filename']),
-            models.Index(fields=['file_type']),
-            models.Index(fields=['uploaded_at']),
-            models.Index(fields=['size']),
+            models.Index(fields=['original_filename'], name='file_fname_idx'),
+            models.Index(fields=['category', '-uploaded_at'], name='cat_upl_idx'),
+            models.Index(fields=['-uploaded_at', 'size'], name='file_date_size'),
+            models.Index(
+                fields=['size'],
+                condition=Q(size__gte=10485760),
+                name='file_large_size_idx',
+            ),
         ]
         ordering = ['-uploaded_at']
 
@@ -121,39 +199,37 @@ class File(models.Model):
     def clean(self):
         """Additional model validation.
 
-        Validates UUID filename format for existing files.
+        Validates UUID filename format for stored files. A newly assigned
+        upload still carries the client's name until upload_to renames it
+        on save, so it is skipped.
         Called automatically during model.full_clean().
 
         Raises:
             ValidationError: If file validation fails
         """
         super().clean()
-        if self.file and not self._state.adding:
+        if self.file and self.file._committed and not self._state.adding:
             validate_uuid_filename(self.file.name)
 
-    def save(self, *args, validate_uuid=True, **kwargs):
-        """Save the model instance with optional UUID validation.
+    def save(self, *args, **kwargs):
+        """Save the model instance.
 
         Args:
-            validate_uuid (bool): Whether to validate UUID filename format.
-                                Set to False during initial file upload.
             *args: Additional positional arguments for model.save()
             **kwargs: Additional keyword arguments for model.save()
 
         Note:
             Automatically determines file category from MIME type
-            and updates file_type field.
+            and updates file_type field. Validation is not repeated here;
+            stored names come from file_upload_path, and admin forms run
+            clean().
         """
-        if validate_uuid:
-            self.full_clean()
-
         # Automatically determine file category from MIME type
         if self.file:
-            mime_type, _ = mimetypes.guess_type(self.original_filename)
-            logger.info(f"File: {self.original_filename}, MIME type: {mime_type}")
-            self.file_type = mime_type or 'application/octet-stream'
+            self.file_type = guess_mime_type(self.original_filename)
+            logger.debug("File: %s, MIME type: %s", self.original_filename, self.file_type)
             self.category = get_file_category(self.file_type)
-            logger.info(f"Categorized as: {self.category}")
+            logger.debug("Categorized as: %s", self.category)
 
         super().save(*args, **kwargs)
 
@@ -173,7 +249,26 @@ class File(models.Model):
         Returns:
             str or None: UUID-based filename without path, or None if no file
         """
-        return os.path.basename(self.file.name) if self.file else None
+        return self.filename
+
+    @staticmethod
+    def _filter_content(queryset, search_term):
+        """Filter a queryset by the extracted text content.
+
+        On PostgreSQL this is a full-text match against the expression GIN
+        index from migration 0004_content_search_index; other backends fall
+        back to a substring scan.
+        """
+        if connection.vendor != 'postgresql':
+            return queryset.filter(content__icontains=search_term)
+
+        from django.contrib.postgres.search import SearchQuery, SearchVector
+
+        return queryset.alias(
+            content_vector=SearchVector('content', config=CONTENT_SEARCH_CONFIG)
+        ).filter(
+            content_vector=SearchQuery(search_term, config=CONTENT_SEARCH_CONFIG)
+        )
 
     @classmethod
     def search(cls, **kwargs):
@@ -183,14 +278,14 @@ class File(models.Model):
             **kwargs: Search parameters
                 search (str): Text to search in filename or content
                 search_type (str): Type of search ('filename' or 'content')
-                type (str): File type filter
+                type (str): File category filter ('image', 'document', ...)
                 date (str): Date filter ('today', 'week', 'month', 'year')
                 size (str): Size filter ('small', 'medium', 'large')
-                start_date (date): Start date for custom range
-                end_date (date): End date for custom range
+                start_date (date or str): Start date for custom range
+                end_date (date or str): End date for custom range, inclusive
 
         Returns:
-            QuerySet: Filtered queryset of File objects
+            QuerySet: Filtered queryset of File objects, with content deferred
 
         Example:
             >>> File.search(search='document', type='pdf', date='month')
@@ -204,73 +299,54 @@ class File(models.Model):
 
         if search_term and len(search_term) >= 2:
             if search_type == 'content':
-                queryset = queryset.filter(content__icontains=search_term)
+                queryset = cls._filter_content(queryset, search_term)
             else:
-                # Use trigram similarity for better filename search if available
+                # On PostgreSQL both substring matches are served by pg_trgm
+                # indexes (migrations 0003 and 0008)
                 queryset = queryset.filter(
                     Q(original_filename__icontains=search_term) |
                     Q(file_type__icontains=search_term)
                 )
 
-        # File type filtering
+        # File type filtering: the category is computed once in save(), so
+        # this is a single indexed equality match
         file_type = kwargs.get('type')
         if file_type:
-            type_filters = {
-                'image': Q(file_type__startswith='image/'),
-                'document': Q(file_type__in=[
-                    'application/pdf',
-                    'application/msword',
-                    'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-                    'text/plain',
-                ]) | Q(file_type__startswith='application/vnd.ms-'),
-                'spreadsheet': Q(file_type__in=[
-                    'text/csv',
-                    'application/vnd.ms-excel',
-                    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-                ]),
-                'video': Q(file_type__startswith='video/'),
-                'audio': Q(file_type__startswith='audio/'),
-                'archive': Q(file_type__in=[
-                    'application/zip',
-                    'application/x-rar-compressed',
-                    'application/x-7z-compressed',
-                    'application/x-tar',
-                    'application/gzip'
-                ])
-            }
-            if file_type in type_filters:
-                queryset = queryset.filter(type_filters[file_type])
+            if file_type in FILE_CATEGORIES:
+                queryset = queryset.filter(category=file_type)
 
         # Date filtering
         date_filter = kwargs.get('date')
-        if date_filter:
-            now = timezone.now()
-            date_filters = {
-                'today': Q(uploaded_at__date=now.date()),
-                'week': Q(uploaded_at__gte=now - timedelta(days=7)),
-                'month': Q(uploaded_at__gte=now - timedelta(days=30)),
-                'year': Q(uploaded_at__gte=now - timedelta(days=365))
-            }
-            if date_filter in date_filters:
-                queryset = queryset.filter(date_filters[date_filter])
+        if date_filter == 'today':
+            today = _start_of_day(timezone.localdate())
+            queryset = queryset.filter(uploaded_at__gte=today, uploaded_at__lt=today + _DAY)
+        elif date_filter == 'week':
+            queryset = queryset.filter(uploaded_at__gte=timezone.now() - _WEEK)
+        elif date_filter == 'month':
+            queryset = queryset.filter(uploaded_at__gte=timezone.now() - _MONTH)
+        elif date_filter == 'year':
+            queryset = queryset.filter(uploaded_at__gte=timezone.now() - _YEAR)
 
         # Custom date range
         start_date = kwargs.get('start_date')
         end_date = kwargs.get('end_date')
+        # Half-open ranges of day boundaries: the end date is inclusive, so
+        # stop before midnight of the following day
         if start_date:
-            queryset = queryset.filter(uploaded_at__date__gte=start_date)
+            start = _start_of_day(start_date)
+            if start:
+                queryset = queryset.filter(uploaded_at__gte=start)
         if end_date:
-            queryset = queryset.filter(uploaded_at__date__lte=end_date)
+            end = _start_of_day(end_date)
+            if end:
+                queryset = queryset.filter(uploaded_at__lt=end + _DAY)
 
         # Size filtering
         size_filter = kwargs.get('size')
         if size_filter:
-            size_filters = {
-                'small': Q(size__lt=1024 * 1024),  # < 1MB
-                'medium': Q(size__gte=1024 * 1024, size__lt=10 * 1024 * 1024),  # 1-10MB
-                'large': Q(size__gte=10 * 1024 * 1024)  # > 10MB
-            }
-            if size_filter in size_filters:
-                queryset = queryset.filter(size_filters[size_filter])
-
-        return queryset
+            if size_filter in _SIZE_FILTERS:
+                queryset = queryset.filter(_SIZE_FILTERS[size_filter])
+
+        # Listings never show the extracted text, so don't load it; filtering
+        # on content above still works on a deferred column
+        return queryset.defer('content')
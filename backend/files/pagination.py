@@ -0,0 +1,16 @@
+from rest_framework.pagination import CursorPagination
+
+
+class FileCursorPagination(CursorPagination):
+    """Opt-in keyset pagination for the file listing.
+
+    Pages are only cut when the client sends ``pageSize``; without it the
+    full listing is returned as before. Cursors seek on uploaded_at, which
+    the (uploaded_at DESC, size) index serves, so there is no COUNT(*) and
+    no OFFSET scan however deep the page.
+    """
+
+    page_size = None
+    page_size_query_param = 'pageSize'
+    max_page_size = 1000
+    ordering = '-uploaded_at'
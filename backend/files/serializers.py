@@ -2,6 +2,7 @@ from rest_framework import serializers
 from .models import File
 from django.conf import settings
 from django.urls import reverse
+import uuid
 
 class FileSerializer(serializers.ModelSerializer):
     url = serializers.SerializerMethodField()
@@ -18,3 +19,50 @@ class FileSerializer(serializers.ModelSerializer):
     class Meta:
         model = File
         fields = ['id', 'file', 'original_filename', 'file_type', 'category', 'size', 'uploaded_at', 'file_hash', 'url']
+
+
+# Columns read by serialize_file_rows(); everything in FileSerializer
+# except the computed download url
+FILE_ROW_FIELDS = ('id', 'file', 'original_filename', 'file_type', 'category',
+                   'size', 'uploaded_at', 'file_hash')
+
+_PK_PLACEHOLDER = str(uuid.UUID(int=0))
+
+
+def serialize_file_rows(rows, request):
+    """Shape File ``values(*FILE_ROW_FIELDS)`` rows like FileSerializer.
+
+    Produces the same output as ``FileSerializer(rows, many=True).data``
+    without DRF's per-field binding, which dominates listing time for
+    large result sets. The download URL is reversed once and the pk
+    substituted per row.
+
+    Args:
+        rows (iterable): Dicts from ``File.objects.values(*FILE_ROW_FIELDS)``
+        request (HttpRequest): Request used to build absolute URLs
+
+    Returns:
+        list: Serialized files
+    """
+    storage = File._meta.get_field('file').storage
+    uploaded_at_field = serializers.DateTimeField()
+    download_url = request.build_absolute_uri(
+        reverse('file-download', kwargs={'pk': _PK_PLACEHOLDER})
+    )
+
+    data = []
+    for row in rows:
+        pk = str(row['id'])
+        name = row['file']
+        data.append({
+            'id': pk,
+            'file': request.build_absolute_uri(storage.url(name)) if name else None,
+            'original_filename': row['original_filename'],
+            'file_type': row['file_type'],
+            'category': row['category'],
+            'size': row['size'],
+            'uploaded_at': uploaded_at_field.to_representation(row['uploaded_at']),
+            'file_hash': row['file_hash'],
+            'url': download_url.replace(_PK_PLACEHOLDER, pk) if name else None,
+        })
+    return data
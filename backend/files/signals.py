@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .caching import bump_list_version
+from .models import File
+
+
+@receiver(post_save, sender=File)
+@receiver(post_delete, sender=File)
+def invalidate_file_listings(sender, **kwargs):
+    """Drop cached file listings whenever a File row changes."""
+    bump_list_version()
@@ -2,8 +2,8 @@ from django.test import TransactionTestCase
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.utils import timezone
-from datetime import timedelta
-from ..models import File, file_upload_path
+from datetime import datetime, timedelta
+from ..models import File, file_upload_path, is_uuid_basename, validate_uuid_filename
 import uuid
 import os
 import hashlib
@@ -88,6 +88,44 @@ class TestFileModel(TransactionTestCase):
         self.assertTrue(file1 in results)
         self.assertTrue(file2 in results)
 
+    def test_search_date_range(self):
+        """Test custom date range filtering"""
+        def create_uploaded_at(name, uploaded_at):
+            content = name.encode()
+            file = File.objects.create(
+                file=SimpleUploadedFile(name, content),
+                original_filename=name,
+                file_type='text/plain',
+                size=len(content),
+                file_hash=hashlib.sha256(content).hexdigest()
+            )
+            # uploaded_at is auto_now_add, so set it after creation
+            File.objects.filter(pk=file.pk).update(uploaded_at=uploaded_at)
+            return file
+
+        tz = timezone.get_current_timezone()
+        before = create_uploaded_at('before.txt', datetime(2024, 3, 9, 23, 59, tzinfo=tz))
+        last_minute = create_uploaded_at('last_minute.txt', datetime(2024, 3, 10, 23, 59, tzinfo=tz))
+        next_midnight = create_uploaded_at('next_midnight.txt', datetime(2024, 3, 11, 0, 0, tzinfo=tz))
+
+        # The end date is inclusive up to, but not including, the next midnight
+        results = File.search(end_date='2024-03-10')
+        self.assertIn(last_minute, results)
+        self.assertNotIn(next_midnight, results)
+
+        # The start date begins at midnight
+        results = File.search(start_date='2024-03-10', end_date='2024-03-10')
+        self.assertEqual(list(results), [last_minute])
+
+        # Invalid dates are ignored rather than raising
+        for invalid in ['2024-02-30', 'junk']:
+            with self.subTest(date=invalid):
+                results = File.search(start_date=invalid, end_date=invalid)
+                self.assertEqual(
+                    {file.pk for file in results},
+                    {before.pk, last_minute.pk, next_midnight.pk}
+                )
+
     def test_file_properties(self):
         """Test file model properties"""
         test_content = b'content'
@@ -108,6 +146,64 @@ class TestFileModel(TransactionTestCase):
         self.assertIsNotNone(file.stored_filename)
         self.assertTrue(file.stored_filename.endswith('.txt'))
 
+    def test_validate_uuid_filename(self):
+        """Test UUID filename validation"""
+        valid_uuid = '123e4567-e89b-12d3-a456-426614174000'
+
+        # Valid names, with or without a directory, in any case
+        validate_uuid_filename(f'{valid_uuid}.jpg')
+        validate_uuid_filename(f'uploads/{valid_uuid}.jpg')
+        validate_uuid_filename(f'{valid_uuid.upper()}.JPG')
+
+        invalid_names = [
+            '123e4567e-89b-12d3-a456-426614174000.jpg',   # moved hyphen
+            '123e4567-e89b-12d3-a456-4266-14174000.jpg',  # extra hyphen
+            '123e4567-e89b-12d3-a456-42661417400g.jpg',   # non-hex digit
+            f'{valid_uuid}.',                             # empty extension
+            f'{valid_uuid}.j-g',                          # non-alphanumeric extension
+            f'{valid_uuid}.jpg\n',                        # trailing newline
+            'invalid.jpg',
+        ]
+        for name in invalid_names:
+            with self.subTest(name=name):
+                with self.assertRaises(ValidationError):
+                    validate_uuid_filename(name)
+
+        for name in [None, '', '   ', 'uploads/']:
+            with self.subTest(name=name):
+                with self.assertRaises(ValidationError):
+                    validate_uuid_filename(name)
+
+    def test_validate_uuid_filename_length_bounds(self):
+        """Test the basename length limits (38 to 255 characters)"""
+        valid_uuid = '123e4567-e89b-12d3-a456-426614174000'
+
+        # Shortest and longest valid basenames
+        validate_uuid_filename(f'{valid_uuid}.x')
+        validate_uuid_filename(f'{valid_uuid}.' + 'x' * 218)
+
+        # One character past the upper bound
+        with self.assertRaises(ValidationError):
+            validate_uuid_filename(f'{valid_uuid}.' + 'x' * 219)
+
+    def test_is_uuid_basename(self):
+        """Test the positional UUID basename check"""
+        valid_uuid = '123e4567-e89b-12d3-a456-426614174000'
+
+        self.assertTrue(is_uuid_basename(f'{valid_uuid}.jpg'))
+        self.assertTrue(is_uuid_basename(f'{valid_uuid}.x'))
+        self.assertTrue(is_uuid_basename(f'{valid_uuid}.mp4'))
+
+        # Expects lowercase input; validate_uuid_filename lowercases first
+        self.assertFalse(is_uuid_basename(f'{valid_uuid.upper()}.jpg'))
+        self.assertFalse(is_uuid_basename(f'{valid_uuid}.'))
+        self.assertFalse(is_uuid_basename(f'{valid_uuid}.j_g'))
+        self.assertFalse(is_uuid_basename(f'{valid_uuid}jpg'))
+        self.assertFalse(is_uuid_basename('123e4567-e89b-12d3-a456-42661417400z.jpg'))
+        self.assertFalse(is_uuid_basename('123e4567-e89b-12d3-a4564-26614174000.jpg'))
+        self.assertFalse(is_uuid_basename('123e4567-e89b-12d3-a456-4266-1417400.jpg'))
+        self.assertFalse(is_uuid_basename('123e4567-e89b-12d3-a456-42661417400.jpg'))
+
     def tearDown(self):
         """Clean up test files"""
         for file in File.objects.all():
@@ -0,0 +1,44 @@
+from django.test import TransactionTestCase, RequestFactory
+from django.core.files.uploadedfile import SimpleUploadedFile
+from ..models import File
+from ..serializers import FILE_ROW_FIELDS, FileSerializer, serialize_file_rows
+import hashlib
+
+class TestSerializeFileRows(TransactionTestCase):
+    def setUp(self):
+        """Set up test data"""
+        self.request = RequestFactory().get('/api/files/')
+        for name, content in [('report.pdf', b'pdf content'), ('photo.png', b'png content')]:
+            File.objects.create(
+                file=SimpleUploadedFile(name, content),
+                original_filename=name,
+                file_type='application/octet-stream',
+                size=len(content),
+                file_hash=hashlib.sha256(content).hexdigest()
+            )
+        # A row whose file was never stored gets neither a file nor a url
+        File.objects.create(
+            file='',
+            original_filename='missing.txt',
+            file_type='text/plain',
+            size=0,
+            file_hash=None
+        )
+
+    def test_matches_file_serializer(self):
+        """Test that shaped rows match FileSerializer output"""
+        expected = FileSerializer(
+            File.objects.all(), many=True, context={'request': self.request}
+        ).data
+        rows = serialize_file_rows(File.objects.values(*FILE_ROW_FIELDS), self.request)
+
+        self.assertEqual(rows, [dict(item) for item in expected])
+
+    def tearDown(self):
+        """Clean up test files"""
+        for file in File.objects.all():
+            if file.file:
+                try:
+                    file.file.delete()
+                except Exception:
+                    pass  # Ignore deletion errors in cleanup
@@ -1,5 +1,9 @@
+import hashlib
+import mimetypes
+import os
+import tempfile
 import unittest
-from ..utils import get_file_category
+from ..utils import get_file_category, guess_mime_type, hash_file_path
 
 class TestFileCategories(unittest.TestCase):
     def test_image_categories(self):
@@ -56,5 +60,38 @@ class TestFileCategories(unittest.TestCase):
         self.assertEqual(get_file_category('application/unknown'), 'other')
         self.assertEqual(get_file_category('invalid/type'), 'other')
 
+class TestGuessMimeType(unittest.TestCase):
+    def test_matches_mimetypes(self):
+        """Cached guesses agree with mimetypes.guess_type, including case"""
+        names = [
+            'photo.JPG', 'report.pdf', 'archive.tar.gz', 'BACKUP.GZ', 'x.XZ',
+            'Data.Tar.Gz', 'bundle.tgz', 'a.b.tgz', '..b', '.bashrc',
+            '.tar.gz', 'README', 'dir.v2/notes', 'data:text/csv,a',
+        ]
+        for name in names:
+            with self.subTest(name=name):
+                expected = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+                self.assertEqual(guess_mime_type(name), expected)
+
+
+class TestHashFilePath(unittest.TestCase):
+    def _write_temp_file(self, content):
+        fd, path = tempfile.mkstemp()
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        self.addCleanup(os.unlink, path)
+        return path
+
+    def test_matches_sha256(self):
+        """Test hashing a file on disk"""
+        content = b'0123456789abcdef' * 100000
+        path = self._write_temp_file(content)
+        self.assertEqual(hash_file_path(path), hashlib.sha256(content).hexdigest())
+
+    def test_empty_file(self):
+        """Test hashing an empty file"""
+        path = self._write_temp_file(b'')
+        self.assertEqual(hash_file_path(path), hashlib.sha256(b'').hexdigest())
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,159 @@
+import hashlib
+import os
+from datetime import timedelta
+from unittest import mock
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db.models.query import QuerySet
+from django.test import TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+from ..models import File, validate_uuid_filename
+
+class TestFileViewSet(TransactionTestCase):
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+
+    def create_file(self, name, content):
+        """Create a stored file row for the given content"""
+        return File.objects.create(
+            file=SimpleUploadedFile(name, content),
+            original_filename=name,
+            file_type='text/plain',
+            size=len(content),
+            file_hash=hashlib.sha256(content).hexdigest()
+        )
+
+    def stored_uploads(self):
+        upload_dir = os.path.join(settings.MEDIA_ROOT, 'uploads')
+        return set(os.listdir(upload_dir)) if os.path.isdir(upload_dir) else set()
+
+    def test_upload_duplicate(self):
+        """Test that re-uploading stored content returns the existing file"""
+        existing = self.create_file('original.txt', b'same content')
+        before = self.stored_uploads()
+
+        response = self.client.post(
+            '/api/files/',
+            {'file': SimpleUploadedFile('copy.txt', b'same content')},
+            format='multipart'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['isDuplicate'])
+        self.assertEqual(response.data['id'], str(existing.id))
+        self.assertEqual(File.objects.count(), 1)
+        self.assertEqual(self.stored_uploads(), before)
+
+    def test_upload_race_removes_orphaned_file(self):
+        """Test that losing the unique-hash race leaves no stored file behind"""
+        existing = self.create_file('original.txt', b'same content')
+        before = self.stored_uploads()
+
+        # Make the duplicate lookup miss once, as if the other upload's row
+        # was committed between the lookup and the INSERT
+        original_first = QuerySet.first
+        missed = []
+
+        def first_missing_once(queryset):
+            if not missed:
+                missed.append(True)
+                return None
+            return original_first(queryset)
+
+        with mock.patch.object(QuerySet, 'first', first_missing_once):
+            response = self.client.post(
+                '/api/files/',
+                {'file': SimpleUploadedFile('copy.txt', b'same content')},
+                format='multipart'
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['isDuplicate'])
+        self.assertEqual(response.data['id'], str(existing.id))
+        self.assertEqual(File.objects.count(), 1)
+        self.assertEqual(self.stored_uploads(), before)
+
+    def test_list_sets_etag(self):
+        """Test that the listing is returned with a weak ETag"""
+        self.create_file('report.txt', b'report')
+
+        response = self.client.get('/api/files/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['files']), 1)
+        self.assertTrue(response['ETag'].startswith('W/"'))
+
+    def test_list_not_modified(self):
+        """Test that a matching If-None-Match returns 304"""
+        self.create_file('report.txt', b'report')
+        etag = self.client.get('/api/files/')['ETag']
+
+        response = self.client.get('/api/files/', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_list_modified_after_edit(self):
+        """Test that editing a file invalidates the listing ETag"""
+        file = self.create_file('report.txt', b'report')
+        etag = self.client.get('/api/files/')['ETag']
+
+        response = self.client.patch(
+            f'/api/files/{file.id}/',
+            {'original_filename': 'renamed.txt'},
+            format='multipart'
+        )
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get('/api/files/', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['files'][0]['original_filename'], 'renamed.txt')
+
+    def test_replace_file(self):
+        """Test that a PATCH replacing the file stores it under a UUID name"""
+        file = self.create_file('report.txt', b'report')
+        old_name = file.file.name
+        self.addCleanup(file.file.storage.delete, old_name)
+
+        response = self.client.patch(
+            f'/api/files/{file.id}/',
+            {'file': SimpleUploadedFile('new.pdf', b'%PDF-1.4')},
+            format='multipart'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        file.refresh_from_db()
+        self.assertNotEqual(file.file.name, old_name)
+        self.assertTrue(file.file.name.endswith('.pdf'))
+        validate_uuid_filename(file.file.name)
+
+    @override_settings(CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}
+    })
+    def test_list_modified_when_date_window_moves(self):
+        """Test that a relative date filter is not answered with a stale 304"""
+        self.create_file('report.txt', b'report')
+        response = self.client.get('/api/files/', {'date': 'week'})
+        self.assertEqual(len(response.data['files']), 1)
+        etag = response['ETag']
+
+        later = timezone.now() + timedelta(days=10)
+        with mock.patch('django.utils.timezone.now', return_value=later):
+            response = self.client.get('/api/files/', {'date': 'week'}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['files'], [])
+        self.assertNotEqual(response['ETag'], etag)
+
+    def tearDown(self):
+        """Clean up test files"""
+        for file in File.objects.all():
+            if file.file:
+                try:
+                    file.file.delete()
+                except Exception:
+                    pass  # Ignore deletion errors in cleanup
@@ -1,3 +1,76 @@
+import hashlib
+import mimetypes
+import mmap
+import os
+import posixpath
+from functools import lru_cache
+from typing import Optional
+
+
+@lru_cache(maxsize=512)
+def _guess_mime_type_for_suffix(suffix: str) -> Optional[str]:
+    return mimetypes.guess_type('x' + suffix)[0]
+
+
+def guess_mime_type(filename: str) -> str:
+    """
+    Guess the MIME type of a filename, caching results by extension.
+
+    The cache key is the last two suffixes, split with ``posixpath.splitext``
+    and kept in their original case, which is all ``mimetypes.guess_type``
+    looks at: ``.tar.gz`` needs both, and encodings such as ``.gz`` are
+    matched case-sensitively. Names with a ``scheme:`` prefix are parsed as
+    URLs by ``mimetypes``, so they bypass the cache.
+    """
+    if ':' in filename:
+        mime_type = mimetypes.guess_type(filename)[0]
+    else:
+        base, ext = posixpath.splitext(filename)
+        suffix = posixpath.splitext(base)[1] + ext if ext else ''
+        mime_type = _guess_mime_type_for_suffix(suffix)
+    return mime_type or 'application/octet-stream'
+
+
+# Exact MIME type matches. None of these belong to one of the major types
+# below, so checking them first gives the same result as the old
+# ordered if/elif chain.
+_EXACT_CATEGORIES = {
+    # Spreadsheets
+    'application/vnd.ms-excel': 'spreadsheet',
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': 'spreadsheet',
+    'text/csv': 'spreadsheet',
+    # Code files
+    'text/x-python': 'code',
+    'application/javascript': 'code',
+    'text/html': 'code',
+    'text/css': 'code',
+    'application/json': 'code',
+    # Documents
+    'application/pdf': 'document',
+    'application/msword': 'document',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'document',
+    # Archives
+    'application/zip': 'archive',
+    'application/x-rar-compressed': 'archive',
+    'application/x-tar': 'archive',
+    'application/x-7z-compressed': 'archive',
+    'application/gzip': 'archive',
+}
+
+# Fallback by major type (the part before the '/')
+_MAJOR_TYPE_CATEGORIES = {
+    'image': 'image',
+    'video': 'video',
+    'audio': 'audio',
+    'text': 'document',
+}
+
+# Every value get_file_category() can return
+FILE_CATEGORIES = frozenset(
+    {*_EXACT_CATEGORIES.values(), *_MAJOR_TYPE_CATEGORIES.values(), 'other'}
+)
+
+
 def get_file_category(mime_type: str) -> str:
     """
     Determine file category based on MIME type.
@@ -7,39 +80,26 @@ def get_file_category(mime_type: str) -> str:
 
     mime_type = mime_type.lower()
 
-    # Images
-    if mime_type.startswith('image/'):
-        return 'image'
-
-    # Videos
-    if mime_type.startswith('video/'):
-        return 'video'
-
-    # Audio
-    if mime_type.startswith('audio/'):
-        return 'audio'
+    category = _EXACT_CATEGORIES.get(mime_type)
+    if category:
+        return category
 
-    # Spreadsheets - Check before general text/* to catch CSV
-    if mime_type in ['application/vnd.ms-excel',
-                    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-                    'text/csv']:
-        return 'spreadsheet'
-
-    # Code files - Check before general text/* to catch specific code types
-    if mime_type in ['text/x-python', 'application/javascript',
-                    'text/html', 'text/css', 'application/json']:
-        return 'code'
+    major_type, slash, _ = mime_type.partition('/')
+    if not slash:
+        return 'other'
+    return _MAJOR_TYPE_CATEGORIES.get(major_type, 'other')
 
-    # Documents - General text/* check comes after specific text/* types
-    if mime_type.startswith('text/') or \
-       mime_type in ['application/pdf', 'application/msword',
-                    'application/vnd.openxmlformats-officedocument.wordprocessingml.document']:
-        return 'document'
 
-    # Archives
-    if mime_type in ['application/zip', 'application/x-rar-compressed',
-                    'application/x-tar', 'application/x-7z-compressed',
-                    'application/gzip']:
-        return 'archive'
+def hash_file_path(path: str) -> str:
+    """
+    Calculate the SHA-256 hex digest of a file on disk.
 
-    return 'other'
+    The file is memory-mapped and hashed in a single update() call, so the
+    kernel pages it in directly and no read buffers are copied into Python.
+    """
+    with open(path, 'rb') as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
@@ -1,12 +1,16 @@
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser
+from django.db import IntegrityError, transaction
 from django.db.models import Q
 from .models import File
-from .serializers import FileSerializer
+from .serializers import FILE_ROW_FIELDS, FileSerializer, serialize_file_rows
+from .utils import guess_mime_type, hash_file_path
+from .caching import LIST_CACHE_TIMEOUT, get_list_version
+from .pagination import FileCursorPagination
 import hashlib
-from django.core.files.base import ContentFile
-import mimetypes
+import json
+from django.core.cache import cache
 import os
 from django.utils import timezone
 from datetime import timedelta
@@ -14,12 +18,56 @@ import logging
 from django.utils.dateparse import parse_date
 import time
 from rest_framework.decorators import action
-from django.http import FileResponse
-from urllib.parse import quote
+from django.http import FileResponse, HttpResponseNotModified
+from django.utils.http import parse_etags, quote_etag
 
 # Get an instance of the custom logger
 logger = logging.getLogger('files')
 
+# Hash fallback chunk size: 16384 SHA-256 blocks per update() call
+HASH_CHUNK_SIZE = 1 << 20
+
+def _hash_upload(file_obj):
+    """Calculate the SHA-256 hex digest of an uploaded file.
+
+    Uploads spooled to disk are memory-mapped and hashed in a single
+    update() call. Otherwise, on Python 3.11+ hashlib.file_digest hashes
+    the in-memory buffer in one call; older interpreters fall back to
+    hashing 1 MiB chunks.
+
+    Args:
+        file_obj (UploadedFile): The uploaded file
+
+    Returns:
+        str: Hexadecimal SHA-256 digest
+    """
+    if hasattr(file_obj, 'temporary_file_path'):
+        return hash_file_path(file_obj.temporary_file_path())
+
+    file_obj.seek(0)
+    if hasattr(hashlib, 'file_digest'):
+        return hashlib.file_digest(file_obj.file, 'sha256').hexdigest()
+
+    sha256 = hashlib.sha256()
+    for chunk in file_obj.chunks(chunk_size=HASH_CHUNK_SIZE):
+        sha256.update(chunk)
+    return sha256.hexdigest()
+
+def _unlink_file(file_path):
+    """Remove a deleted file's contents from disk.
+
+    Runs after the delete has committed, when the response no longer
+    depends on it, so failures are logged rather than raised. A file that
+    is already gone is not an error.
+    """
+    try:
+        os.unlink(file_path)
+        logger.info("Physical file deleted successfully: %s", file_path)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        logger.exception("Failed to delete physical file: %s", file_path)
+
 class FileViewSet(viewsets.ModelViewSet):
     """ViewSet for handling file operations.
 
@@ -33,11 +81,13 @@ class FileViewSet(viewsets.ModelViewSet):
     Attributes:
         serializer_class: Serializer for File model
         parser_classes: Supported request parsers (MultiPartParser for file uploads)
+        pagination_class: Opt-in cursor pagination (pass ``pageSize``)
         queryset: Base queryset for File objects
     """
 
     serializer_class = FileSerializer
     parser_classes = (MultiPartParser,)
+    pagination_class = FileCursorPagination
     queryset = File.objects.all()
 
     def get_serializer_context(self):
@@ -62,52 +112,110 @@ class FileViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        # Open the file and create a FileResponse
-        file_path = instance.file.path
-        if not os.path.exists(file_path):
+        # Open the file directly; a missing file shows up as the open failing
+        try:
+            file_handle = open(instance.file.path, 'rb')
+        except FileNotFoundError:
             return Response(
                 {'error': 'File not found on disk'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        # URL encode the filename to handle special characters
-        encoded_filename = quote(instance.original_filename)
-
-        response = FileResponse(
-            open(file_path, 'rb'),
+        # FileResponse hands the open file to the server's wsgi.file_wrapper
+        # (sendfile where supported) and builds the Content-Disposition
+        # header, encoding non-ASCII filenames per RFC 5987
+        return FileResponse(
+            file_handle,
+            as_attachment=True,
+            filename=instance.original_filename,
             content_type=instance.file_type or 'application/octet-stream'
         )
-        response['Content-Disposition'] = f'attachment; filename="{encoded_filename}"'
-        return response
+
+    def _get_cache_key(self):
+        """Build the listing cache key for the current request.
+
+        The key combines the listing version, the absolute base URL (the
+        serialized file URLs are absolute) and the sorted query params.
+        """
+        params = sorted(self.request.query_params.lists())
+        raw = json.dumps([self.request.build_absolute_uri('/'), params])
+        digest = hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+        return f'filelist:{get_list_version()}:{digest}'
+
+    @staticmethod
+    def _get_etag(listing):
+        """Build a weak ETag from the serialized listing itself.
+
+        Any change to the returned rows (new, deleted or edited files, or a
+        relative date window moving) changes the digest. The ETag is weak
+        because the timing metrics in the body differ between otherwise
+        identical responses.
+        """
+        raw = json.dumps(listing, sort_keys=True)
+        return 'W/' + quote_etag(hashlib.blake2b(raw.encode(), digest_size=16).hexdigest())
+
+    @staticmethod
+    def _etag_matches(etag, if_none_match):
+        """Weakly compare an ETag against an If-None-Match header."""
+        client_etags = {tag.removeprefix('W/') for tag in parse_etags(if_none_match)}
+        return '*' in client_etags or etag.removeprefix('W/') in client_etags
 
     def list(self, request, *args, **kwargs):
         start_time = time.time()
 
-        # Get the queryset
-        queryset = self.get_queryset()
-
-        # Time the serialization separately
-        serialize_start = time.time()
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
-        serialize_time = (time.time() - serialize_start) * 1000  # Convert to milliseconds
+        # Only the listing itself (and its ETag) is cached; metrics always
+        # describe this request
+        cache_key = self._get_cache_key()
+        cached = cache.get(cache_key)
+        cache_hit = cached is not None
+        serialize_time = 0.0
+
+        if cache_hit:
+            listing, etag = cached
+        else:
+            # Get the rows as dicts, cut to one page if the client asked for one
+            queryset = self.get_queryset().values(*FILE_ROW_FIELDS)
+            page = self.paginate_queryset(queryset)
+
+            # Time the serialization separately; rows are shaped directly
+            # rather than through FileSerializer (same output)
+            serialize_start = time.time()
+            listing = {'files': serialize_file_rows(queryset if page is None else page, request)}
+            serialize_time = (time.time() - serialize_start) * 1000  # Convert to milliseconds
+
+            if page is not None:
+                listing['next'] = self.paginator.get_next_link()
+                listing['previous'] = self.paginator.get_previous_link()
+
+            etag = self._get_etag(listing)
+            cache.set(cache_key, (listing, etag), LIST_CACHE_TIMEOUT)
+
+        # Answer repeat polls of an unchanged listing with 304 Not Modified
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if if_none_match and self._etag_matches(etag, if_none_match):
+            response = HttpResponseNotModified()
+            response['ETag'] = etag
+            return response
 
         # Calculate total query time
         total_time = (time.time() - start_time) * 1000  # Convert to milliseconds
 
         # Log the timing information
-        logger.info(f"Query executed in {total_time:.2f}ms (Serialization: {serialize_time:.2f}ms)")
+        logger.info(
+            "Query executed in %.2fms (Serialization: %.2fms, cache hit: %s)",
+            total_time, serialize_time, cache_hit
+        )
 
         # Include timing information in the response data
         response_data = {
-            'files': data,
+            **listing,
             'metrics': {
                 'queryTime': round(total_time, 2),
-                'serializeTime': round(serialize_time, 2)
+                'serializeTime': round(serialize_time, 2),
+                'cacheHit': cache_hit
             }
         }
-
-        return Response(response_data)
+        return Response(response_data, headers={'ETag': etag})
 
     def get_queryset(self):
         # Log filter operations
@@ -119,11 +227,13 @@ class FileViewSet(viewsets.ModelViewSet):
         start_date = self.request.query_params.get('startDate', None)
         end_date = self.request.query_params.get('endDate', None)
 
-        if any([search, date_filter, size_filter, file_type, start_date, end_date]):
+        if logger.isEnabledFor(logging.INFO) and any(
+            [search, date_filter, size_filter, file_type, start_date, end_date]
+        ):
             logger.info(
-                f"Filtering files with params: search='{search}', type='{search_type}', "
-                f"date='{date_filter}', size='{size_filter}', file_type='{file_type}', "
-                f"startDate='{start_date}', endDate='{end_date}'"
+                "Filtering files with params: search='%s', type='%s', date='%s', "
+                "size='%s', file_type='%s', startDate='%s', endDate='%s'",
+                search, search_type, date_filter, size_filter, file_type, start_date, end_date
             )
 
         # Use the new search method
@@ -142,24 +252,16 @@ class FileViewSet(viewsets.ModelViewSet):
             instance = self.get_object()
             file_path = instance.file.path if instance.file else None
 
-            logger.info(f"Attempting to delete file: {instance.original_filename} (ID: {instance.id})")
+            logger.info("Attempting to delete file: %s (ID: %s)", instance.original_filename, instance.id)
 
-            # Delete the physical file first
-            if file_path and os.path.exists(file_path):
-                try:
-                    os.remove(file_path)
-                    logger.info(f"Physical file deleted successfully: {file_path}")
-                except OSError as e:
-                    error_msg = f"Failed to delete physical file: {str(e)}"
-                    logger.error(error_msg)
-                    return Response(
-                        {'error': error_msg},
-                        status=status.HTTP_500_INTERNAL_SERVER_ERROR
-                    )
-
-            # Delete the database record
-            instance.delete()
-            logger.info(f"File record deleted from database: {instance.original_filename}")
+            # Delete the database record; the physical file is only removed
+            # once the delete has committed, so a failed delete never leaves
+            # a row pointing at a missing file
+            with transaction.atomic():
+                instance.delete()
+                if file_path:
+                    transaction.on_commit(lambda: _unlink_file(file_path))
+            logger.info("File record deleted from database: %s", instance.original_filename)
 
             return Response(status=status.HTTP_204_NO_CONTENT)
         except Exception as e:
@@ -198,57 +300,67 @@ class FileViewSet(viewsets.ModelViewSet):
             return Response({'error': 'No file provided'}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            logger.info(f"Starting upload process for file: {file_obj.name}")
+            logger.info("Starting upload process for file: %s", file_obj.name)
 
             # Get the original filename as string
             original_filename = os.path.basename(file_obj.name)
 
-            # Calculate SHA256 hash without modifying the original object
-            sha256 = hashlib.sha256()
-            file_bytes = b''
+            # Hash the upload in a single streaming pass; the content is
+            # never held in memory as a whole
+            file_hash = _hash_upload(file_obj)
+            size = file_obj.size
+            logger.info("File hash calculated: %s... (truncated)", file_hash[:8])
 
-            for chunk in file_obj.chunks():
-                sha256.update(chunk)
-                file_bytes += chunk
-
-            file_hash = sha256.hexdigest()
-            logger.info(f"File hash calculated: {file_hash[:8]}... (truncated)")
-
-            # Check if file with same hash already exists
-            existing_file = File.objects.filter(file_hash=file_hash).first()
-            if existing_file:
-                logger.info(f"Duplicate file detected: {original_filename} matches existing file {existing_file.original_filename}")
-                serializer = self.get_serializer(existing_file)
+            # Ensure we have a valid file type
+            file_type = getattr(file_obj, 'content_type', None)
+            if not file_type:
+                # Try to guess the type from the filename (cached per extension)
+                file_type = guess_mime_type(original_filename)
+                logger.info("File type determined: %s", file_type)
+
+            # Rewind so storage copies (or moves, for temporary files) the
+            # upload itself instead of a re-wrapped in-memory copy
+            file_obj.seek(0)
+
+            # file_hash is unique, so concurrent identical uploads cannot both
+            # create a row: the loser's INSERT fails and it returns the
+            # winner's record instead
+            file_instance = File.objects.filter(file_hash=file_hash).first()
+            created = file_instance is None
+            if created:
+                file_instance = File(
+                    file=file_obj,
+                    original_filename=original_filename,
+                    file_type=file_type,
+                    size=size,
+                    file_hash=file_hash
+                )
+                try:
+                    with transaction.atomic():
+                        file_instance.save(force_insert=True)
+                except IntegrityError:
+                    # FileField.pre_save stored the upload before the INSERT
+                    # failed; remove it so it is not left orphaned
+                    file_instance.file.delete(save=False)
+                    file_instance = File.objects.filter(file_hash=file_hash).first()
+                    if file_instance is None:
+                        raise
+                    created = False
+            if not created:
+                logger.info(
+                    "Duplicate file detected: %s matches existing file %s",
+                    original_filename, file_instance.original_filename
+                )
+                serializer = self.get_serializer(file_instance)
                 return Response({
                     **serializer.data,
                     'isDuplicate': True,
                     'message': 'File already exists'
                 }, status=status.HTTP_200_OK)
 
-            # Re-wrap file content so Django can store it
-            new_file = ContentFile(file_bytes)
-            new_file.name = original_filename
-
-            # Ensure we have a valid file type
-            file_type = getattr(file_obj, 'content_type', None)
-            if not file_type:
-                # Try to guess the type from the filename
-                guessed_type = mimetypes.guess_type(original_filename)[0]
-                file_type = guessed_type or 'application/octet-stream'
-                logger.info(f"File type determined: {file_type}")
-
-            # Create file instance
-            file_instance = File.objects.create(
-                file=new_file,
-                original_filename=original_filename,
-                file_type=file_type,
-                size=len(file_bytes),
-                file_hash=file_hash
-            )
-
             logger.info(
-                f"File uploaded successfully: {original_filename} "
-                f"(ID: {file_instance.id}, Size: {len(file_bytes)} bytes, Type: {file_type})"
+                "File uploaded successfully: %s (ID: %s, Size: %d bytes, Type: %s)",
+                original_filename, file_instance.id, size, file_type
             )
 
             serializer = self.get_serializer(file_instance)
@@ -261,7 +373,7 @@ class FileViewSet(viewsets.ModelViewSet):
             error_msg = f"Upload failed for {file_obj.name if file_obj else 'unknown file'}: {str(e)}"
             logger.error(error_msg)
             import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Traceback: %s", traceback.format_exc())
             return Response(
                 {
                     'error': error_msg,